@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 import os
+import errno
 import re
 import json
 import argparse
 import shutil
 import logging
 import colorlog
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path  # make sure this is imported
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class DryRunFilter(logging.Filter):
@@ -68,6 +75,65 @@ def configure_logging(level_name: str) -> None:
     logger.setLevel(numeric_level)
 
 
+def _split_suffix(name: str) -> Tuple[str, str]:
+    """Split a file name into stem and suffix with pathlib's rules.
+
+    Unlike os.path.splitext, a trailing dot is not treated as a suffix.
+
+    Examples:
+        'Show [01].mkv' -> ('Show [01]', '.mkv')
+        'Show [01].mkv.' -> ('Show [01].mkv.', '')
+        '.hidden' -> ('.hidden', '')
+    """
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[:i], name[i:]
+    return name, ""
+
+
+def _split_brackets(s: str) -> Tuple[List[str], str]:
+    """Split bracketed sections out of a name in a single pass.
+
+    Args:
+        s: The name to split
+
+    Returns:
+        A tuple of (bracket contents in order, name with brackets removed)
+
+    Examples:
+        '[Group] Series [01-12] [1080p]' -> (['Group', '01-12', '1080p'], 'Series')
+    """
+    brackets = []
+    parts = []
+    pos = 0
+    while True:
+        start = s.find("[", pos)
+        if start == -1:
+            break
+        end = s.find("]", start + 1)
+        if end == -1:
+            break
+        parts.append(s[pos:start])
+        brackets.append(s[start + 1 : end])
+        pos = end + 1
+    parts.append(s[pos:])
+    return brackets, "".join(parts).strip()
+
+
+def dump_json(obj) -> str:
+    """Serialize parsed metadata as indented JSON, using orjson when installed.
+
+    Args:
+        obj: The object to serialize; non-JSON values such as Path become strings
+
+    Returns:
+        The indented JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+
+
 def parse_file_name(path: Path) -> Dict:
     original = path
     subtitle_groups = []
@@ -76,29 +142,26 @@ def parse_file_name(path: Path) -> Dict:
 
     name = original.name
     dir = name
-    root = str(original.parent)
+    root = original.parent
 
     # Step 1: Extract all bracketed sections
-    bracket_sections = re.findall(r"\[(.*?)\]", name)
+    bracket_sections, name = _split_brackets(name)
 
     # Step 2: First bracket is usually group
     if bracket_sections:
         first = bracket_sections[0]
         # support &-joined groups
         subtitle_groups = [g.strip() for g in first.split("&")]
-        name = name.replace(f"[{first}]", "").strip()
 
     # Step 3: Remaining brackets are format/episode info
     for b in bracket_sections[1:]:
-        if re.search(EPISODE_RANGE_PATTERN, b):  # like 01-12
+        if _EP_RANGE_RE.search(b):  # like 01-12
             episode_range = b.strip()
         else:
             video_format_parts.append(b.strip())
 
-        name = name.replace(f"[{b}]", "").strip()
-
     # Step 4: Clean leading dash / extra characters
-    name = re.sub(r"^[-\s]+", "", name)
+    name = _LEADING_DASH_RE.sub("", name)
     # Step 5: Clean series name from season indicators
     series_name = clean_series_name(name.strip())
 
@@ -107,7 +170,7 @@ def parse_file_name(path: Path) -> Dict:
         "subtitle_groups": subtitle_groups,
         "video_format": video_format_parts,
         "episode_range": episode_range,
-        "raw": str(original),
+        "raw": original,
         "root": root,
         "dir": dir,
     }
@@ -130,6 +193,79 @@ LANGUAGE_CODE_PATTERN = (
 # Special content patterns: recognize various special content indicators
 SPECIAL_CONTENT_PATTERN = r"(SPs?|OVA|OAD|映像特典|特典|Specials?|Extras?|Bonus|NCED\d*|NCOP\d*|OP\d*|ED\d*|MENU\d*|PV\d*|CM\d*|第[\d一二三四五六七八九十百]+[话話]?(?:ED|OP))"
 
+# Library root for organized series, and archive root for original folders
+_DST_ROOT = Path("/Volumes/NAS_SSD/Media/Anime")
+_ORIG_ROOT = Path("/Volumes/NAS_SSD/Media/orig")
+
+# Files skipped by link_file_loop
+_IGNORE_EXTS = frozenset({".zip", ".rar", ".7z", ".tar", ".gz", ".xz", ".png", ".txt"})
+_IGNORE_NAMES = frozenset({".DS_Store"})
+# Concurrent os.link calls; linking is bound by filesystem (NAS) latency
+_LINK_WORKERS = 8
+
+# Precompiled patterns used on every scanned file
+_LEADING_DASH_RE = re.compile(r"^[-\s]+")
+_EP_RANGE_RE = re.compile(EPISODE_RANGE_PATTERN)
+_SEASON_SEASON_RE = re.compile(SEASON_PATTERN_SEASON, re.IGNORECASE)
+_SEASON_SXX_RE = re.compile(SEASON_PATTERN_SXX)
+_SEASON_JP_RE = re.compile(SEASON_PATTERN_JAPANESE)
+_SPECIAL_RE = re.compile(SPECIAL_CONTENT_PATTERN, re.IGNORECASE)
+# Special content name patterns, tried in order by extract_special_content_name
+_SP_COMPOUND_RE = re.compile(
+    r"((?:NCED|NCOP|MENU|PV|CM|OVA|OAD|SP|OP|ED)\d*(?:[&+](?:NCED|NCOP|MENU|PV|CM|OVA|OAD|SP|OP|ED)?\d*)*)",
+    re.IGNORECASE,
+)
+_SP_CHINESE_RE = re.compile(r"(第[\d一二三四五六七八九十百]+[话話]?(?:ED|OP))", re.IGNORECASE)
+_SP_OTHER_RE = re.compile(
+    r"(NCED\d*|NCOP\d*|MENU\d*|PV\d*|CM\d*|OVA\d*|OAD\d*|SP\d*)", re.IGNORECASE
+)
+_SP_SIMPLE_RE = re.compile(r"\b(OP\d*|ED\d*)\b", re.IGNORECASE)
+# Season indicators stripped by clean_series_name
+_CLEAN_SEASON_RE = re.compile(r"\s+Season\s+\d+", re.IGNORECASE)
+_CLEAN_SXX_RE = re.compile(r"\s+S\d+$")
+_CLEAN_NUMBER_RE = re.compile(r"\s+\d+$")
+# Filename season patterns used by get_season_from_filename
+_FILE_SEASON_SXX_EXX_RE = re.compile(r"S(\d{1,2})E\d+")
+_FILE_SEASON_SXX_RE = re.compile(r"\bS(\d{1,2})\b")
+_EP_BRACKET_RE = re.compile(EPISODE_PATTERN_BRACKET)
+_EP_SXX_RE = re.compile(EPISODE_PATTERN_SXX_EXX)
+_EP_JP_RE = re.compile(EPISODE_PATTERN_JAPANESE)
+_LANG_RE = re.compile(LANGUAGE_CODE_PATTERN)
+# Only these can carry a language code; other files skip the language probe
+_SUBTITLE_EXTS = frozenset({".ass", ".srt", ".vtt", ".sub", ".ssa"})
+
+
+def _match_episode(filename: str) -> Optional[int]:
+    """Return the episode number from the first pattern that matches."""
+    # Bracket format first, then SxxExx, then Japanese
+    match = (
+        _EP_BRACKET_RE.search(filename)
+        or _EP_SXX_RE.search(filename)
+        or _EP_JP_RE.search(filename)
+    )
+    return int(match.group(1)) if match else None
+
+
+def _scan_file_meta(
+    filename: str, suffix: str
+) -> Tuple[Optional[int], Optional[str]]:
+    """Parse the episode number and language code of a file.
+
+    Args:
+        filename: The filename to parse
+        suffix: The file extension, used to skip the language probe for
+            non-subtitle files
+
+    Returns:
+        A tuple of (episode number, language code), either of which may be None
+    """
+    language_code = None
+    if suffix in _SUBTITLE_EXTS:
+        match = _LANG_RE.search(filename)
+        if match:
+            language_code = match.group(1)
+    return _match_episode(filename), language_code
+
 
 def parse_episode_number(filename: str) -> Optional[int]:
     """Parse episode number from filename using multiple patterns.
@@ -145,22 +281,7 @@ def parse_episode_number(filename: str) -> Optional[int]:
         'Tower.of.God.S02E23.mkv' -> 23
         '[Snow-Raws] ばらかもん 第08話.mkv' -> 8
     """
-    # Try bracket format first (original pattern)
-    match = re.search(EPISODE_PATTERN_BRACKET, filename)
-    if match:
-        return int(match.group(1))
-
-    # Try SxxExx format
-    match = re.search(EPISODE_PATTERN_SXX_EXX, filename)
-    if match:
-        return int(match.group(1))
-
-    # Try Japanese format
-    match = re.search(EPISODE_PATTERN_JAPANESE, filename)
-    if match:
-        return int(match.group(1))
-
-    return None
+    return _match_episode(filename)
 
 
 def parse_season_number(path_or_filename: str) -> int:
@@ -179,17 +300,17 @@ def parse_season_number(path_or_filename: str) -> int:
         'Regular Series' -> 1 (default)
     """
     # Try "Season X" format
-    match = re.search(SEASON_PATTERN_SEASON, path_or_filename, re.IGNORECASE)
+    match = _SEASON_SEASON_RE.search(path_or_filename)
     if match:
         return int(match.group(1))
 
     # Try "SXX" format
-    match = re.search(SEASON_PATTERN_SXX, path_or_filename)
+    match = _SEASON_SXX_RE.search(path_or_filename)
     if match:
         return int(match.group(1))
 
     # Try Japanese format
-    match = re.search(SEASON_PATTERN_JAPANESE, path_or_filename)
+    match = _SEASON_JP_RE.search(path_or_filename)
     if match:
         return int(match.group(1))
 
@@ -211,7 +332,7 @@ def is_special_content(path_or_filename: str) -> bool:
         'OVA' -> True
         'regular_episode.mkv' -> False
     """
-    return bool(re.search(SPECIAL_CONTENT_PATTERN, path_or_filename, re.IGNORECASE))
+    return bool(_SPECIAL_RE.search(path_or_filename))
 
 
 def extract_special_content_name(filename: str) -> Optional[str]:
@@ -232,8 +353,7 @@ def extract_special_content_name(filename: str) -> Optional[str]:
     """
     # First try to match compound special content patterns (multiple indicators with separators)
     # Look for patterns like "PV&CM4", "NCOP1&2", "OP&ED", etc.
-    compound_pattern = r"((?:NCED|NCOP|MENU|PV|CM|OVA|OAD|SP|OP|ED)\d*(?:[&+](?:NCED|NCOP|MENU|PV|CM|OVA|OAD|SP|OP|ED)?\d*)*)"
-    match = re.search(compound_pattern, filename, re.IGNORECASE)
+    match = _SP_COMPOUND_RE.search(filename)
     if match:
         compound_name = match.group(1)
         # Check if it's actually a compound name (contains & or +) or a valid single name
@@ -242,20 +362,17 @@ def extract_special_content_name(filename: str) -> Optional[str]:
         # If it's a single name but matches our pattern, continue to other checks for better matching
 
     # Then try to match Chinese/Japanese episode-specific patterns
-    chinese_pattern = r"(第[\d一二三四五六七八九十百]+[话話]?(?:ED|OP))"
-    match = re.search(chinese_pattern, filename, re.IGNORECASE)
+    match = _SP_CHINESE_RE.search(filename)
     if match:
         return match.group(1)
 
     # Try other special content patterns (single indicators)
-    other_pattern = r"(NCED\d*|NCOP\d*|MENU\d*|PV\d*|CM\d*|OVA\d*|OAD\d*|SP\d*)"
-    match = re.search(other_pattern, filename, re.IGNORECASE)
+    match = _SP_OTHER_RE.search(filename)
     if match:
         return match.group(1)
 
     # Finally try simple OP/ED patterns (as fallback)
-    simple_pattern = r"\b(OP\d*|ED\d*)\b"
-    match = re.search(simple_pattern, filename, re.IGNORECASE)
+    match = _SP_SIMPLE_RE.search(filename)
     if match:
         return match.group(1)
 
@@ -279,11 +396,11 @@ def clean_series_name(series_name: str) -> str:
     """
     # Remove common season patterns but preserve special ones like "II", "III"
     # Remove "Season X" patterns
-    cleaned = re.sub(r'\s+Season\s+\d+', '', series_name, flags=re.IGNORECASE)
+    cleaned = _CLEAN_SEASON_RE.sub('', series_name)
     # Remove "S\d+" patterns at the end
-    cleaned = re.sub(r'\s+S\d+$', '', cleaned)
+    cleaned = _CLEAN_SXX_RE.sub('', cleaned)
     # Remove standalone season numbers at the end
-    cleaned = re.sub(r'\s+\d+$', '', cleaned)
+    cleaned = _CLEAN_NUMBER_RE.sub('', cleaned)
 
     return cleaned.strip()
 
@@ -298,12 +415,12 @@ def get_season_from_filename(filename: str) -> Optional[int]:
         Season number if found in filename, None otherwise
     """
     # Try SxxExx format first (most reliable)
-    match = re.search(r'S(\d{1,2})E\d+', filename)
+    match = _FILE_SEASON_SXX_EXX_RE.search(filename)
     if match:
         return int(match.group(1))
 
     # Try standalone Sxx format
-    match = re.search(r'\bS(\d{1,2})\b', filename)
+    match = _FILE_SEASON_SXX_RE.search(filename)
     if match:
         return int(match.group(1))
 
@@ -325,7 +442,7 @@ def extract_language_code(filename: str) -> Optional[str]:
         'file.zh-Hans.vtt' -> 'zh-Hans'
         'file.mp4' -> None
     """
-    match = re.search(LANGUAGE_CODE_PATTERN, filename)
+    match = _LANG_RE.search(filename)
     return match.group(1) if match else None
 
 
@@ -337,116 +454,145 @@ def link_file_loop(
     dry_run: bool = False,
     is_episode=False,
 ) -> None:
-    file_path_list = []
-    ignore_exts = [".zip", ".rar", ".7z", ".tar", ".gz", ".xz", ".png", ".txt"]
-    ignore_file = [".DS_Store"]
-    logger.info(f"Source directory: {src_dir}")
-    logger.info(f"Target directory: {dst_dir}")
+    dst_seen: Dict[str, int] = {}
+    counter = 0
+    # First source for each destination, linked concurrently
+    link_pairs = []
+    # Later sources for an already-taken destination, linked afterwards
+    duplicate_pairs = []
+    dst_prefix = str(dst_dir) + os.sep
+    ep_prefix = f"{series_name} S{season_num:02d}E"
+    logger.info("Source directory: %s", src_dir)
+    logger.info("Target directory: %s", dst_dir)
     logger.info("Would link: Source -> Target")
-    for file in src_dir.iterdir():
-        if file.is_file() and file.suffix not in ignore_exts:
-            if file.name in ignore_file:
-                logger.debug(f"SKIP file: {file.name}")
-                continue
-            # Extract language code for subtitle files
-            language_code = extract_language_code(file.name)
-            logger.debug(f"language_code: {language_code}")
-
-            ep_num = parse_episode_number(file.name)
-            logger.debug(f"ep_num: {ep_num}")
-
-            if ep_num is not None and is_episode:
-                # Regular episode file
-                if language_code:
-                    new_filename = f"{series_name} S{season_num:02d}E{ep_num:02d}.{language_code}{file.suffix}"
-                else:
-                    new_filename = (
-                        f"{series_name} S{season_num:02d}E{ep_num:02d}{file.suffix}"
-                    )
-            else:
-                # Special file - try to extract meaningful name
-                special_name = extract_special_content_name(file.name)
-                logger.debug(f"special_name: {special_name}")
-
-                if special_name:
-                    # Use extracted special content name
-                    sp_name = special_name
-                else:
-                    # Fallback to video format or file stem
-                    video_formats = parse_file_name(file)["video_format"]
-                    sp_name = video_formats[0] if video_formats else file.stem
-
-                logger.debug(f"final sp_name: {sp_name}")
-
-                if language_code:
-                    new_filename = f"{sp_name}.{language_code}{file.suffix}"
-                else:
-                    new_filename = f"{sp_name}{file.suffix}"
-
-            dst_file = dst_dir / new_filename
-            num_this = len(file_path_list) + 1
-            if dst_file in file_path_list:
-                number = file_path_list.index(dst_file) + 1
-                logger.warning(
-                    f"{num_this:02d}. duplicate with {number:02d}. :{new_filename} <- {file.name}"
-                )
+    with os.scandir(src_dir) as it:
+        entries = [entry for entry in it if entry.is_file()]
+    for entry in entries:
+        name = entry.name
+        stem, suffix = _split_suffix(name)
+        if suffix in _IGNORE_EXTS:
+            continue
+        if name in _IGNORE_NAMES:
+            logger.debug("SKIP file: %s", name)
+            continue
+        # Extract episode number and language code in a single scan
+        ep_num, language_code = _scan_file_meta(name, suffix)
+        logger.debug("language_code: %s", language_code)
+        logger.debug("ep_num: %s", ep_num)
+
+        # Language code (if any) goes between the new name and the extension
+        name_suffix = f".{language_code}{suffix}" if language_code else suffix
+
+        if ep_num is not None and is_episode:
+            # Regular episode file
+            new_filename = f"{ep_prefix}{ep_num:02d}{name_suffix}"
+        else:
+            # Special file - try to extract meaningful name
+            special_name = extract_special_content_name(name)
+            logger.debug("special_name: %s", special_name)
+
+            if special_name:
+                # Use extracted special content name
+                sp_name = special_name
             else:
-                logger.info(f"{num_this:02d}. {new_filename} <- {file.name}")
-            file_path_list.append(dst_file)
-            logger.debug(f"<< SRC File: {file}")
-            logger.debug(f">> DST File: {dst_file}")
-            if not dry_run:
-                try:
-                    os.link(file, dst_file)
-                except OSError as e:
-                    logger.error(f"Failed to link {file} -> {dst_file}: {e}")
-                    exit(255)
+                # Fallback to video format or file stem
+                video_formats = parse_file_name(Path(entry.path))["video_format"]
+                sp_name = video_formats[0] if video_formats else stem
+
+            logger.debug("final sp_name: %s", sp_name)
+            new_filename = sp_name + name_suffix
+
+        dst_file = dst_prefix + new_filename
+        counter += 1
+        prev = dst_seen.get(dst_file)
+        if prev is not None:
+            logger.warning(
+                "%02d. duplicate with %02d. :%s <- %s", counter, prev, new_filename, name
+            )
+            duplicate_pairs.append((entry.path, dst_file))
+        else:
+            logger.info("%02d. %s <- %s", counter, new_filename, name)
+            dst_seen[dst_file] = counter
+            link_pairs.append((entry.path, dst_file))
+        logger.debug("<< SRC File: %s", entry.path)
+        logger.debug(">> DST File: %s", dst_file)
+
+    if dry_run:
+        return
+    with ThreadPoolExecutor(max_workers=_LINK_WORKERS) as executor:
+        futures = {
+            executor.submit(os.link, src_file, dst_file): (src_file, dst_file)
+            for src_file, dst_file in link_pairs
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except OSError as e:
+                src_file, dst_file = futures[future]
+                logger.error("Failed to link %s -> %s: %s", src_file, dst_file, e)
+                for pending in futures:
+                    pending.cancel()
+                exit(255)
+
+    # Duplicates run serially in listing order once the pool is done, so the
+    # first-listed file always owns the destination and the first duplicate
+    # fails the same way on every run
+    for src_file, dst_file in duplicate_pairs:
+        try:
+            os.link(src_file, dst_file)
+        except OSError as e:
+            logger.error("Failed to link %s -> %s: %s", src_file, dst_file, e)
+            exit(255)
 
 
 def rearrange_directory(
-    meta: Dict[str, str],
+    meta: Dict,
     dry_run: bool = False,
 ) -> None:
-    dst_root = Path("/Volumes/NAS_SSD/Media/Anime")
-    orig_root = Path("/Volumes/NAS_SSD/Media/orig")
     series_name = meta["series_name"]
-    src_root = Path(meta["root"])
-    src_dir = Path(meta["raw"])
-    dst_dir = dst_root / series_name
+    src_root = meta["root"]
+    src_dir = meta["raw"]
+    dst_dir = _DST_ROOT / series_name
+
+    # List the source directory once; reused for season and special folders
+    with os.scandir(src_dir) as it:
+        entries = list(it)
 
     # Detect season number - prioritize filename over folder
     # First, try to detect season from any file in the directory
     season_from_files = None
-    for file in src_dir.iterdir():
-        if file.is_file():
-            file_season = get_season_from_filename(file.name)
+    for entry in entries:
+        if entry.is_file():
+            file_season = get_season_from_filename(entry.name)
             if file_season:
                 season_from_files = file_season
-                logger.debug(f"detected season from file '{file.name}': {file_season}")
+                logger.debug(
+                    "detected season from file '%s': %s", entry.name, file_season
+                )
                 break
 
     # Use file-based season if found, otherwise fall back to folder-based
     if season_from_files:
         season_num = season_from_files
-        logger.debug(f"using season from filename: {season_num}")
+        logger.debug("using season from filename: %s", season_num)
     else:
         season_num = parse_season_number(str(src_dir))
-        logger.debug(f"using season from folder: {season_num}")
+        logger.debug("using season from folder: %s", season_num)
 
     if dry_run:
-        logger.info(f"[DRY RUN] Would create DST directory: {dst_dir}")
+        logger.info("[DRY RUN] Would create DST directory: %s", dst_dir)
     else:
         dst_dir.mkdir(parents=True, exist_ok=True)
-    logger.debug(f"name: {series_name}")
-    logger.debug(f"root: {src_root}")
-    logger.debug(f"src dir: {src_dir}")
-    logger.debug(f"dst dir: {dst_dir}")
+    logger.debug("name: %s", series_name)
+    logger.debug("root: %s", src_root)
+    logger.debug("src dir: %s", src_dir)
+    logger.debug("dst dir: %s", dst_dir)
 
     dst_season = dst_dir / f"Season {season_num:02d}"
     dst_extras = dst_dir / "extras"
     if dry_run:
-        logger.info(f"[DRY RUN] Would create directory: {dst_season}")
-        logger.info(f"[DRY RUN] Would create directory: {dst_extras}")
+        logger.info("[DRY RUN] Would create directory: %s", dst_season)
+        logger.info("[DRY RUN] Would create directory: %s", dst_extras)
     else:
         dst_season.mkdir(parents=True, exist_ok=True)
         dst_extras.mkdir(parents=True, exist_ok=True)
@@ -458,28 +604,40 @@ def rearrange_directory(
     # Enhanced Special Content Detection
     logger.info("## START SPECIAL CONTENT")
 
+    subdirs = {entry.name: entry for entry in entries if entry.is_dir()}
+
     # Check for traditional "SPs" folder
-    special_dir = src_dir / "SPs"
-    if special_dir.exists() and special_dir.is_dir():
+    special_entry = subdirs.get("SPs")
+    if special_entry is not None:
+        special_dir = Path(special_entry.path)
         link_file_loop(special_dir, dst_extras, series_name, season_num, dry_run)
 
     # Check for other special content folders
     special_folders = ["映像特典", "特典", "OVA", "OAD", "Specials", "Extras", "Bonus"]
     for folder_name in special_folders:
-        special_path = src_dir / folder_name
-        if special_path.exists() and special_path.is_dir():
-            logger.info(f"Found special content folder: {folder_name}")
+        special_entry = subdirs.get(folder_name)
+        if special_entry is not None:
+            logger.info("Found special content folder: %s", folder_name)
+            special_path = Path(special_entry.path)
             link_file_loop(special_path, dst_extras, series_name, season_num, dry_run)
 
-    orig_dir = orig_root / meta["dir"]
+    orig_dir = _ORIG_ROOT / meta["dir"]
 
-    logger.info(f"Moving SRC to : {orig_dir}")
+    logger.info("Moving SRC to : %s", orig_dir)
     if dry_run:
-        logger.info(f"[DRY RUN] SRC Would Move: {orig_dir}")
+        logger.info("[DRY RUN] SRC Would Move: %s", orig_dir)
     elif not orig_dir.exists():
-        shutil.move(src_dir, orig_dir)
+        orig_dir.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.rename(src_dir, orig_dir)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Source and archive are on different filesystems: copy + delete
+            logger.warning("Cross-device move, copying: %s -> %s", src_dir, orig_dir)
+            shutil.move(src_dir, orig_dir)
     else:
-        logger.warning(f"[WARNING] Directory exists: {orig_dir}")
+        logger.warning("[WARNING] Directory exists: %s", orig_dir)
 
 
 def main():
@@ -510,13 +668,13 @@ def main():
     for path_str in args.names:
         path = Path(path_str)
         if not path.exists():
-            logger.error(f"Path does not exist: {path_str}")
+            logger.error("Path does not exist: %s", path_str)
             continue
         if not path.is_dir():
-            logger.error(f"Path is not a directory: {path_str}")
+            logger.error("Path is not a directory: %s", path_str)
             continue
         meta_dir = parse_file_name(path)
-        print(json.dumps(meta_dir, indent=2, ensure_ascii=False))
+        print(dump_json(meta_dir))
         rearrange_directory(meta_dir, dry_run)
 
 